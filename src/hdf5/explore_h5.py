@@ -54,40 +54,36 @@ def explore_h5_file(filepath):
             if obj.size > 0 and obj.size <= 100:
                 print(f"  Data:\n{obj[:]}")
             elif obj.size > 0:
-                # Show shape and sample values
-                if len(obj.shape) == 1:
-                    sample = obj[:min(10, obj.shape[0])]
+                # One capped slice read per dataset, reused for both
+                # the sample printout and the stats - every separate
+                # slice pays HDF5 chunk lookup + decompression again
+                ndim = len(obj.shape)
+                if ndim == 1:
+                    arr = obj[:min(1000, obj.shape[0])]
+                    sample = arr[:10]
                     print(f"  Sample (first {len(sample)}): {sample}")
-                    if obj.shape[0] > 10:
-                        sample_data = obj[:1000]
-                        print(f"  Stats: min={np.min(sample_data)}, "
-                              f"max={np.max(sample_data)}, "
-                              f"mean={np.mean(sample_data):.6f}")
-                elif len(obj.shape) == 2:
+                elif ndim == 2:
+                    arr = obj[:min(100, obj.shape[0])]
                     rows = min(3, obj.shape[0])
                     cols = min(5, obj.shape[1])
-                    sample = obj[:rows, :cols]
-                    print(f"  Sample ({rows}x{cols}):\n{sample}")
-                    if obj.size > 1000:
-                        chunk = obj[:min(100, obj.shape[0])]
-                        print(f"  Stats: min={np.min(chunk)}, "
-                          f"max={np.max(chunk)}, "
-                          f"mean={np.mean(chunk):.6f}")
-                elif len(obj.shape) == 3:
+                    print(f"  Sample ({rows}x{cols}):\n{arr[:rows, :cols]}")
+                elif ndim == 3:
                     # 3D array - show first slice
+                    arr = obj[:min(10, obj.shape[0])]
                     d0, d1, d2 = min(2, obj.shape[0]), min(5, obj.shape[1]), min(5, obj.shape[2])
-                    sample = obj[:d0, :d1, :d2]
+                    sample = arr[:d0, :d1, :d2]
                     print(f"  Sample ({d0}x{d1}x{d2}):")
                     print(f"    First slice:\n{sample[0]}")
-                    if obj.size > 1000:
-                        chunk = obj[:min(10, obj.shape[0])]
-                        print(f"  Stats: min={np.min(chunk)}, "
-                              f"max={np.max(chunk)}, "
-                              f"mean={np.mean(chunk):.6f}")
                 else:
                     print(f"  Multi-dimensional array (showing first element):")
                     idx = tuple([0] * len(obj.shape))
                     print(f"  {obj[idx]}")
+                    arr = None
+
+                if arr is not None and obj.size > 1000:
+                    print(f"  Stats: min={np.min(arr)}, "
+                          f"max={np.max(arr)}, "
+                          f"mean={np.mean(arr):.6f}")
                     
         elif isinstance(obj, h5py.Group):
             print(f"\nGROUP: {name}")
@@ -98,7 +94,11 @@ def explore_h5_file(filepath):
         print(f"ANALYZING: {filepath}")
         print("="*80)
 
-        with h5py.File(filepath, 'r') as f:
+        # Large chunk cache (256 MB) so sequential sample reads don't
+        # evict and re-decompress the same chunks
+        with h5py.File(filepath, 'r',
+                       rdcc_nbytes=256*1024*1024,
+                       rdcc_nslots=1_000_003) as f:
             print(f"\nRoot keys: {list(f.keys())}")
             print("\nFull structure:")
             print("-" * 80)
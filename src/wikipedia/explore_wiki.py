@@ -27,11 +27,20 @@ def explore_database(db_path):
 
         # Get all tables
         cursor.execute("Select name from sqlite_master Where type='table';")
-        tables = cursor.fetchall()
-
-        print(f"\nFound {len(tables)} table(s):")
-        for table in tables:
-            table_name = table[0]
+        table_names = [row[0] for row in cursor.fetchall()]
+
+        # Batch all row counts into one round-trip instead of a
+        # separate COUNT(*) query per table
+        row_counts = {}
+        if table_names:
+            count_sql = " UNION ALL ".join(
+                f"SELECT '{name}', COUNT(*) FROM {name}"
+                for name in table_names)
+            cursor.execute(count_sql)
+            row_counts = dict(cursor.fetchall())
+
+        print(f"\nFound {len(table_names)} table(s):")
+        for table_name in table_names:
             print(f"\n{'='*80}")
             print(f"TABLE: {table_name}")
             print('='*80)
@@ -53,10 +62,8 @@ def explore_database(db_path):
                       f"{'NOT NULL' if notnull else 'NULL':8s} "
                       f"{'PK' if pk else '':2s}")
 
-            # Get row count
-            cursor.execute(f"SELECT Count(*) FROM {table_name};")
-            count = cursor.fetchone()[0]
-            print(f"\nTotal rows: {count:,}")
+            # Row count (from the batched query above)
+            print(f"\nTotal rows: {row_counts[table_name]:,}")
 
             # Get sample data
             cursor.execute(f"SELECT * FROM {table_name} LIMIT 3;")
@@ -76,7 +83,7 @@ def explore_database(db_path):
                             display_value = value
                         print(f"   {col_name}: {display_value}")
 
-        conn.close
+        conn.close()
 
         print("\n" + "="*80)
         print("EXPLORATION COMPLETE")